@@ -37,10 +37,10 @@ class QualityManager:
 
     def run_check(self, data: DataContainer, check_name: str) -> QualityReport:
         """Run a specific quality check on the data."""
-        if check_name not in self.checks:
+        try:
+            check = self.checks[check_name]
+        except KeyError:
             raise ValueError(f"Check '{check_name}' not found")
-
-        check = self.checks[check_name]
         if not check.can_handle(data):
             raise ValueError(f"Check '{check_name}' cannot handle this data type")
 
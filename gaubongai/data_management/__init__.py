@@ -1,9 +1,9 @@
 """Data management module."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Optional
 from pathlib import Path
 
-from .types import DataContainer, BasePlugin, DataCategory
+from .types import DataContainer, BasePlugin
 
 
 class DataProcessor:
@@ -12,12 +12,10 @@ class DataProcessor:
     This class coordinates the complete data processing workflow:
     - Loading data through loaders
     - Transforming data through pipelines
-    - Storing processed data
 
     Attributes:
-        loaders: Manages data source loaders
-        transformers: Manages data transformers
-        data_storage: Handles data persistence
+        loader: Loads data from a source
+        transformers: Transformer or list of transformers to apply
     """
 
     def __init__(
@@ -26,7 +24,14 @@ class DataProcessor:
         transformers: Optional[BasePlugin] = None,
     ):
         self.loader = loader
-        self.transformers = transformers
+        if isinstance(transformers, BasePlugin):
+            transformers = [transformers]
+        self.transformers = transformers or []
+        # Resolve each transformer's bound methods once so per-container
+        # execution avoids repeated attribute lookups.
+        self._ops = tuple(
+            (t.can_transform, t.transform, t.name) for t in self.transformers
+        )
 
     def process_file(
         self,
@@ -52,19 +57,8 @@ class DataProcessor:
         # Load data
         data_container = self.loader.load(file_path, **kwargs)
 
-        if isinstance(self.transformers, BasePlugin):
-            self.transformers = [self.transformers]
-
         # Process through transformers if specified
-        if self.transformers:
-            for transformer in self.transformers:
-                if transformer.can_transform(data_container):
-                    data_container = transformer.transform(data_container)
-                else:
-                    raise ValueError(
-                        f"Transformer {transformer.name} cannot transform the data"
-                    )
-        return data_container
+        return self.process_data_container(data_container)
 
     def process_data_container(
         self, data_container: DataContainer, **kwargs
@@ -74,33 +68,9 @@ class DataProcessor:
         Args:
             data_container: DataContainer to process
         """
-        if isinstance(self.transformers, BasePlugin):
-            self.transformers = [self.transformers]
-
-        if self.transformers:
-            for transformer in self.transformers:
-                if transformer.can_transform(data_container):
-                    data_container = transformer.transform(data_container)
-                else:
-                    raise ValueError(
-                        f"Transformer {transformer.name} cannot transform the data"
-                    )
+        for can_transform, transform, name in self._ops:
+            if can_transform(data_container):
+                data_container = transform(data_container)
+            else:
+                raise ValueError(f"Transformer {name} cannot transform the data")
         return data_container
-
-    def get_metadata(
-        self, name: str, category: Optional[DataCategory] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Retrieve metadata for stored data."""
-        return self.data_storage.get_metadata(name, category)
-
-    def list_data(
-        self, category: Optional[DataCategory] = None
-    ) -> Union[List[str], Dict[DataCategory, List[str]]]:
-        """
-        List available data.
-        If category is specified, returns list of names in that category.
-        Otherwise, returns dict of names by category.
-        """
-        if category:
-            return self.data_storage.list_by_category(category)
-        return self.data_storage.list_all()
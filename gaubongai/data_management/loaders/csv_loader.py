@@ -9,22 +9,65 @@ class PandasCSVLoader(BasePlugin):
     """CSV plugin using pandas implementation."""
 
     name = "pandas_csv"
-    supported_extensions = [".csv", ".tsv", ".txt"]
+    supported_extensions = frozenset({".csv", ".tsv", ".txt"})
     data_category = DataCategory.TABULAR
 
-    def load(self, file_path: Path, **kwargs) -> DataContainer:
-        """Load CSV file using pandas."""
+    def load(self, file_path, **kwargs) -> DataContainer:
+        """Load CSV data using pandas from a path or a file-like object.
+
+        Pass ``parquet_cache=True`` to keep a Parquet sidecar next to the CSV:
+        the first load writes ``<file>.parquet`` and later loads read it back
+        instead of re-parsing the CSV, as long as the CSV has not changed.
+        """
+        if hasattr(file_path, "read"):
+            # In-memory buffers (StringIO etc.) skip the filesystem checks
+            # and the sidecar cache entirely.
+            kwargs.pop("parquet_cache", None)
+            try:
+                data = pd.read_csv(file_path, **kwargs)
+            except Exception as e:
+                raise ValueError(f"Error loading CSV file: {e}")
+            return DataContainer(
+                data=data,
+                metadata={
+                    "category": self.data_category,
+                    "rows": len(data),
+                    "dtypes": {col: str(dtype) for col, dtype in data.dtypes.items()},
+                },
+            )
+
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         if not file_path.suffix.lower() in self.supported_extensions:
             raise ValueError(f"Unsupported file extension: {file_path.suffix}")
+        parquet_cache = kwargs.pop("parquet_cache", False)
+        # read_csv kwargs (usecols, dtype, nrows, ...) shape the parsed
+        # frame, but the sidecar's validity check is mtime-only; a cached
+        # read would ignore them and a write would poison later plain
+        # loads. Only cache the default, kwarg-free parse.
+        if kwargs:
+            parquet_cache = False
         try:
-            data = pd.read_csv(file_path, **kwargs)
+            cache_hit = False
+            pq_path = file_path.with_suffix(file_path.suffix + ".parquet")
+            if (
+                parquet_cache
+                and pq_path.exists()
+                and pq_path.stat().st_mtime >= file_path.stat().st_mtime
+            ):
+                data = pd.read_parquet(pq_path)
+                cache_hit = True
+            else:
+                data = pd.read_csv(file_path, **kwargs)
+                if parquet_cache:
+                    data.to_parquet(pq_path)
             metadata = {
                 "category": self.data_category,
                 "rows": len(data),
-                "dtypes": data.dtypes.astype(str).to_dict(),
+                "dtypes": {col: str(dtype) for col, dtype in data.dtypes.items()},
             }
+            if parquet_cache:
+                metadata["cache_hit"] = cache_hit
             return DataContainer(
                 data=data,
                 metadata=metadata,
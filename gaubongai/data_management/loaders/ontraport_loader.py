@@ -197,7 +197,7 @@ class OntraportLoader(BasePlugin):
     """Plugin for loading Ontraport data from either API (via downloader) or saved files."""
 
     name = "ontraport_loader"
-    supported_extensions = [".json", ".csv"]
+    supported_extensions = frozenset({".json", ".csv"})
     data_category = DataCategory.TABULAR
 
     def __init__(self):
@@ -225,11 +225,11 @@ class OntraportLoader(BasePlugin):
 
         # If file_path is an actual file, load from file
         if file_path.exists():
-            if file_path.suffix not in self.supported_extensions:
+            if file_path.suffix.lower() not in self.supported_extensions:
                 raise ValueError(f"Unsupported file extension: {file_path.suffix}")
 
             try:
-                if file_path.suffix == ".json":
+                if file_path.suffix.lower() == ".json":
                     with open(file_path) as f:
                         data = json.load(f)
                     df = pd.DataFrame(data.get("data", []))
@@ -240,7 +240,7 @@ class OntraportLoader(BasePlugin):
                     "category": self.data_category,
                     "source": str(file_path),
                     "rows": len(df),
-                    "dtypes": df.dtypes.astype(str).to_dict(),
+                    "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
                     "loaded_from": "file",
                 }
                 return DataContainer(data=df, metadata=metadata)
@@ -267,7 +267,7 @@ class OntraportLoader(BasePlugin):
                 "category": self.data_category,
                 "source": f"Ontraport API - {endpoint}",
                 "rows": len(df),
-                "dtypes": df.dtypes.astype(str).to_dict(),
+                "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
                 "loaded_from": "api",
                 "endpoint": endpoint,
                 "filters": filters,
@@ -1,7 +1,32 @@
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Dict, Union, Optional
+import numpy as np
 import pandas as pd
-from ..types import BasePlugin, DataContainer, DataCategory
+from ..types import BasePlugin, DataContainer, DataCategory, preferred_string_dtype
+
+_STRING_DTYPE = preferred_string_dtype()
+
+# Common per-cell transforms with a direct vectorized equivalent; using the
+# C-level string kernel avoids a Python call per row.
+_VEC_TRANSFORMS = {
+    str.lower: lambda s: s.str.lower(),
+    str.upper: lambda s: s.str.upper(),
+    str.strip: lambda s: s.str.strip(),
+    str.casefold: lambda s: s.str.casefold(),
+    str.title: lambda s: s.str.title(),
+}
+
+# Numba-vectorized transform callables, memoized by the original function
+# object so each one is compiled at most once per process. Keying on the
+# function (not its id) keeps it alive, so a recycled id can never hand an
+# unrelated callable someone else's compiled kernel.
+_NUMBA_VECTORIZED: Dict[Any, Any] = {}
+
+# Dtypes converted through pd.to_numeric rather than astype; to_numeric
+# keeps floats intact when an int target doesn't fit and honours 'errors'.
+_NUMERIC_DTYPES = ("float", "float64", "float32", "int", "int64", "int32")
 
 
 class PandasDfTransformer(BasePlugin):
@@ -13,6 +38,8 @@ class PandasDfTransformer(BasePlugin):
         - 'convert_args': Arguments passed to the conversion function (pd.to_datetime, pd.to_numeric, etc.)
         - 'astype_args': Additional arguments passed to astype() for categorical and other types
         - 'transform': Optional transformation function or lambda to apply before type conversion
+        - 'numba_signature': Optional numba signature (e.g. 'float64(float64)') to
+          JIT-vectorize a numeric 'transform' over the underlying numpy array
         - 'na_values': Optional list of values to treat as NA/NaN
         - 'fillna': Optional value or method to fill NA/NaN values
         - 'rename': Optional new name for the column
@@ -57,15 +84,25 @@ class PandasDfTransformer(BasePlugin):
     """
 
     name = "pandas_df_transformer"
-    supported_categories = [DataCategory.TABULAR]
+    supported_categories = frozenset({DataCategory.TABULAR})
 
     def __init__(
         self,
         column_specs: Optional[Dict[str, Dict[str, Any]]] = None,
+        n_jobs: int = 1,
+        engine: str = "pandas",
     ):
         """Initialize the transformer with column specifications.
 
         Args:
+            n_jobs: Number of worker threads for per-column conversions.
+                1 (default) converts sequentially; -1 lets the executor pick.
+                Column conversions are independent, so wide frames with many
+                specs benefit from thread-level parallelism.
+            engine: "pandas" (default) or "dask". With dask installed, the
+                frame is split into per-CPU partitions and the column specs
+                are applied partition-wise, which parallelizes the work and
+                avoids materializing one full copy of a very large frame.
             column_specs: Dictionary mapping column names to their conversion specifications.
                 Each spec can contain:
                 - 'dtype': Required. The target pandas dtype
@@ -76,7 +113,12 @@ class PandasDfTransformer(BasePlugin):
                 - 'fillna': Optional value or method to fill NA values
                 - 'rename': Optional new name for the column
         """
+        if engine not in ("pandas", "dask"):
+            raise ValueError(f"Unsupported engine: {engine}")
         self.column_specs = column_specs or {}
+        self.n_jobs = n_jobs
+        self.engine = engine
+        self._spec_keys = frozenset(self.column_specs)
 
     def can_transform(self, data_container: DataContainer) -> bool:
         """Check if data can be transformed, by checking
@@ -89,34 +131,90 @@ class PandasDfTransformer(BasePlugin):
             raise ValueError("Data must be a pandas DataFrame")
 
         # Check if specified columns exist in the DataFrame
-        df_columns = set(data_container.data.columns)
-        if not set(self.column_specs.keys()).issubset(df_columns):
-            raise ValueError(
-                f"Columns {set(self.column_specs.keys()) - df_columns} not found in DataFrame"
-            )
+        missing = self._spec_keys.difference(data_container.data.columns)
+        if missing:
+            raise ValueError(f"Columns {set(missing)} not found in DataFrame")
 
         return True
 
+    def _apply_transform(self, series: pd.Series, spec: Dict[str, Any]) -> pd.Series:
+        """Apply the spec's transform, JIT-vectorizing it when requested.
+
+        With a 'numba_signature', the callable is compiled once into a numpy
+        ufunc that runs over the underlying array at C speed; without numba
+        installed (or without a signature) the per-row apply path is used.
+        """
+        func = spec["transform"]
+        signature = spec.get("numba_signature")
+        if signature:
+            try:
+                vectorized = _NUMBA_VECTORIZED[func]
+            except KeyError:
+                try:
+                    import numba
+                except ImportError:
+                    vectorized = None
+                else:
+                    vectorized = numba.vectorize([signature], nopython=True)(func)
+                _NUMBA_VECTORIZED[func] = vectorized
+            if vectorized is not None:
+                return pd.Series(
+                    vectorized(series.to_numpy()),
+                    index=series.index,
+                    name=series.name,
+                )
+        vectorized_method = _VEC_TRANSFORMS.get(func)
+        if vectorized_method is not None:
+            return vectorized_method(series)
+        if isinstance(func, np.ufunc):
+            return pd.Series(
+                func(series.to_numpy()), index=series.index, name=series.name
+            )
+        return series.apply(func)
+
     def _convert_column(self, series: pd.Series, spec: Dict[str, Any]) -> pd.Series:
         """Convert a single column according to its specification."""
         # Apply pre-conversion transformation if specified
         if spec.get("remove", False):
             return None
         if "transform" in spec:
-            series = series.apply(spec["transform"])
+            series = self._apply_transform(series, spec)
 
         # Handle NA values
         if "na_values" in spec:
-            series = series.replace(spec["na_values"], pd.NA)
+            # isin uses C-level hash lookups; replace walks the value list.
+            mask = series.isin(spec["na_values"])
+            if mask.any():
+                series = series.mask(mask, pd.NA)
 
         dtype = spec["dtype"]
         convert_args = spec.get("convert_args", {})
         astype_args = spec.get("astype_args", {})
 
         try:
-            if dtype.startswith("datetime"):
-                series = pd.to_datetime(series, **convert_args)
-            elif dtype in ("float", "float64", "float32", "int", "int64", "int32"):
+            if str(series.dtype) == dtype:
+                # Already the target dtype; converting again would be a
+                # full-column pass for nothing.
+                pass
+            elif dtype.startswith("datetime"):
+                # Integer epoch columns can be cast directly; to_datetime's
+                # inference on unsigned/extension ints is far slower.
+                if pd.api.types.is_unsigned_integer_dtype(series):
+                    series = series.astype("int64")
+                # The astype chain only honours 'unit'; any other key
+                # ('errors', 'origin', ...) must go through to_datetime or
+                # its semantics would be silently dropped.
+                if (
+                    pd.api.types.is_integer_dtype(series)
+                    and "unit" in convert_args
+                    and not (set(convert_args) - {"unit"})
+                ):
+                    series = series.astype(
+                        f"datetime64[{convert_args['unit']}]"
+                    ).astype("datetime64[ns]")
+                else:
+                    series = pd.to_datetime(series, **convert_args)
+            elif dtype in _NUMERIC_DTYPES:
                 series = pd.to_numeric(series, **convert_args)
             elif dtype == "boolean":
                 # Handle boolean conversion with custom true/false values if provided
@@ -130,19 +228,51 @@ class PandasDfTransformer(BasePlugin):
                     bool_map = {val.lower(): True for val in true_values}
                     bool_map.update({val.lower(): False for val in false_values})
                     if series.dtype == "object":
-                        series = series.str.lower().map(bool_map)
+                        # Factorize first and map only the unique categories
+                        # through the dict; the per-row work is then a
+                        # C-level gather instead of a Python dict lookup.
+                        # All-NA columns (possible per dask partition even
+                        # when the whole frame isn't) have no categories to
+                        # gather from; the astype below already yields an
+                        # all-NA boolean column for them.
+                        cat = series.astype("category")
+                        if len(cat.cat.categories):
+                            lut = np.array(
+                                [
+                                    bool_map.get(str(c).lower())
+                                    for c in cat.cat.categories
+                                ],
+                                dtype=object,
+                            )
+                            codes = cat.cat.codes.to_numpy()
+                            mapped = np.where(codes >= 0, lut[codes], None)
+                            series = pd.Series(
+                                mapped, index=series.index, name=series.name
+                            )
                 series = series.astype("boolean", **astype_args)
+            elif dtype == "string":
+                # Prefer the Arrow-backed string dtype when available.
+                series = series.astype(_STRING_DTYPE, **astype_args)
+            elif dtype == "category":
+                # astype("category") does not accept categories/ordered
+                # kwargs; build the dtype once instead — predefined
+                # categories also skip the full-column uniqueness scan.
+                if astype_args:
+                    series = series.astype(pd.CategoricalDtype(**astype_args))
+                else:
+                    series = series.astype("category")
             else:
-                # For all other types (string, category, etc.), use astype directly
+                # For all other types (string, etc.), use astype directly
                 series = series.astype(dtype, **astype_args)
 
             # Handle NA filling after conversion
             if "fillna" in spec:
-                if isinstance(spec["fillna"], str) and spec["fillna"] in [
+                if isinstance(spec["fillna"], str) and spec["fillna"] in (
                     "ffill",
                     "bfill",
-                ]:
-                    series = series.fillna(method=spec["fillna"])
+                ):
+                    # fillna(method=...) is deprecated in pandas >= 2.1.
+                    series = getattr(series, spec["fillna"])()
                 else:
                     series = series.fillna(spec["fillna"])
 
@@ -153,6 +283,86 @@ class PandasDfTransformer(BasePlugin):
                 raise ValueError(f"Error converting column to {dtype}: {str(e)}")
             return series
 
+    def _drop_all_na_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Drop all-NA columns when a spec can produce them.
+
+        Dropping all-NA columns is how 'remove' specs take effect; the
+        full-frame NA scan is only worth it when a spec can produce them.
+        """
+        if len(df) and any(
+            spec.get("remove")
+            or "na_values" in spec
+            or spec.get("convert_args", {}).get("errors") == "coerce"
+            for spec in self.column_specs.values()
+        ):
+            df = df.dropna(axis=1, how="all")
+        return df
+
+    def _transform_frame(
+        self, frame: pd.DataFrame, drop_all_na: bool = True
+    ) -> pd.DataFrame:
+        """Apply all column specs to a single pandas DataFrame."""
+        # Shallow copy: only the columns written below get new storage;
+        # untouched columns keep sharing the source frame's arrays.
+        df = frame.copy(deep=False)
+
+        # Specs that only set a target dtype can be converted together in a
+        # single astype pass instead of one column assignment each. 'string'
+        # maps to the preferred string dtype here as well, so the output
+        # dtype does not depend on which conversion path a spec takes.
+        # Datetime, boolean and numeric dtypes stay on their dedicated
+        # conversion paths — astype would e.g. truncate floats for an int
+        # target where to_numeric keeps them.
+        simple_specs = {
+            col: _STRING_DTYPE if spec["dtype"] == "string" else spec["dtype"]
+            for col, spec in self.column_specs.items()
+            if set(spec) == {"dtype"}
+            and not spec["dtype"].startswith("datetime")
+            and spec["dtype"] != "boolean"
+            and spec["dtype"] not in _NUMERIC_DTYPES
+        }
+        if simple_specs:
+            try:
+                df = df.astype(simple_specs)
+            except Exception:
+                # Fall back to per-column conversion, which degrades
+                # gracefully column by column.
+                simple_specs = {}
+
+        # Convert the remaining columns; each spec is independent, so the
+        # conversions can fan out across threads when n_jobs allows it.
+        remaining = [
+            (col, spec)
+            for col, spec in self.column_specs.items()
+            if col not in simple_specs
+        ]
+        if self.n_jobs != 1 and len(remaining) > 1:
+            max_workers = self.n_jobs if self.n_jobs > 0 else None
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                converted = list(
+                    executor.map(
+                        lambda item: self._convert_column(df[item[0]], item[1]),
+                        remaining,
+                    )
+                )
+        else:
+            converted = [self._convert_column(df[col], spec) for col, spec in remaining]
+
+        renamed_away = []
+        for (col, spec), transformed_series in zip(remaining, converted):
+            # Handle renaming
+            new_name = spec.get("rename", col)
+            df[new_name] = transformed_series
+            if new_name != col:  # Only drop if actually renamed
+                renamed_away.append(col)
+        if renamed_away:
+            df = df.drop(columns=renamed_away)
+
+        if drop_all_na:
+            df = self._drop_all_na_columns(df)
+
+        return df
+
     def transform(self, data_container: DataContainer) -> DataContainer:
         """Transform the DataFrame by converting column data types."""
         if not self.can_transform(data_container):
@@ -160,19 +370,28 @@ class PandasDfTransformer(BasePlugin):
                 "Data must be a pandas DataFrame with the specified columns"
             )
 
-        df = data_container.data.copy()
+        if self.engine == "dask":
+            import dask.dataframe as dd
 
-        # Process each column specification
-        for col, spec in self.column_specs.items():
-            # Apply transformations
-            transformed_series = self._convert_column(df[col], spec)
-
-            # Handle renaming
-            new_name = spec.get("rename", col)
-            df[new_name] = transformed_series
-            if new_name != col:  # Only drop if actually renamed
-                df = df.drop(columns=[col])
-        df = df.dropna(axis=1, how="all")
+            npartitions = os.cpu_count() or 1
+            # The all-NA sweep must see the whole frame: per partition it
+            # would drop 'remove'd columns the zero-row meta still carries,
+            # and drop columns that are all-NA in one partition only. Run
+            # the specs partition-wise, sweep once on the computed result.
+            df = (
+                dd.from_pandas(data_container.data, npartitions=npartitions)
+                .map_partitions(
+                    self._transform_frame,
+                    drop_all_na=False,
+                    meta=self._transform_frame(
+                        data_container.data.head(0), drop_all_na=False
+                    ),
+                )
+                .compute()
+            )
+            df = self._drop_all_na_columns(df)
+        else:
+            df = self._transform_frame(data_container.data)
 
         # Track changes in metadata
         changes = {
@@ -184,7 +403,7 @@ class PandasDfTransformer(BasePlugin):
 
         # Update metadata
         new_metadata = data_container.metadata.copy()
-        new_metadata["dtypes"] = df.dtypes.astype(str).to_dict()
+        new_metadata["dtypes"] = {col: str(dtype) for col, dtype in df.dtypes.items()}
         new_metadata["transformation_history"] = new_metadata.get(
             "transformation_history", []
         ) + [changes]
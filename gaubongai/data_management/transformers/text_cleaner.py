@@ -0,0 +1,151 @@
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from ..types import BasePlugin, DataContainer, DataCategory, preferred_string_dtype
+
+_STRING_DTYPE = preferred_string_dtype()
+
+# Kept as plain strings: the Arrow-backed string kernels only accept string
+# patterns (compiled objects crash fullmatch and force replace onto the
+# slow object fallback), and pandas caches the compiled form internally.
+_PAT_NONWORD = r"[^\w\s.]"
+_PAT_WS = r"\s+"
+_PAT_NUM = r"\d*\.?\d+\s*"
+
+
+class TextCleaner(BasePlugin):
+    """Normalize free-text columns using vectorized pandas string methods.
+
+    Cleaning lowercases text, replaces non-word characters (except dots)
+    with spaces, collapses runs of whitespace, and strips the result.
+    Purely numeric values keep their compact form (no inserted spaces).
+
+    The whole pipeline runs through pandas' C-level string kernels rather
+    than a per-cell Python function, so cost scales with column count, not
+    cell count.
+    """
+
+    name = "text_cleaner"
+    supported_categories = frozenset({DataCategory.TABULAR})
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        backend: str = "pandas",
+    ):
+        """Initialize the cleaner.
+
+        Args:
+            columns: Columns to clean. Defaults to all object/string columns.
+            backend: "pandas" (default) or "polars". The polars backend runs
+                the cleaning expressions as one multi-threaded lazy plan over
+                the target columns only, which is faster on large frames.
+        """
+        if backend not in ("pandas", "polars"):
+            raise ValueError(f"Unsupported backend: {backend}")
+        self.columns = columns
+        self.backend = backend
+        self._spec_keys = frozenset(columns or ())
+
+    def can_transform(self, data_container: DataContainer) -> bool:
+        """Check if data is a tabular DataFrame containing the target columns."""
+        if not data_container.metadata.get("category") in self.supported_categories:
+            return False
+
+        if not isinstance(data_container.data, pd.DataFrame):
+            raise ValueError("Data must be a pandas DataFrame")
+
+        missing = self._spec_keys.difference(data_container.data.columns)
+        if missing:
+            raise ValueError(f"Columns {set(missing)} not found in DataFrame")
+
+        return True
+
+    def _target_columns(self, df: pd.DataFrame) -> List[str]:
+        """Resolve which columns to clean."""
+        if self.columns is not None:
+            return self.columns
+        return list(df.select_dtypes(include=["object", "string"]).columns)
+
+    def _clean_series(self, series: pd.Series) -> pd.Series:
+        """Clean a single string column with vectorized operations."""
+        s = series.astype(_STRING_DTYPE).str.lower()
+        s = (
+            s.str.replace(_PAT_NONWORD, " ", regex=True)
+            .str.replace(_PAT_WS, " ", regex=True)
+            .str.strip()
+        )
+        # Purely numeric values should stay compact rather than keeping
+        # spaces introduced by the punctuation replacement.
+        numeric_mask = s.str.fullmatch(_PAT_NUM).fillna(False)
+        return s.where(~numeric_mask, s.str.replace(" ", "", regex=False))
+
+    def _clean_columns_polars(
+        self, df: pd.DataFrame, target_columns: List[str]
+    ) -> pd.DataFrame:
+        """Clean the target columns through a single lazy polars plan."""
+        import polars as pl
+
+        def clean_expr(col: str) -> "pl.Expr":
+            s = (
+                pl.col(col)
+                .cast(pl.Utf8)
+                .str.to_lowercase()
+                .str.replace_all(r"[^\w\s.]", " ")
+                .str.replace_all(r"\s+", " ")
+                .str.strip_chars()
+            )
+            return (
+                pl.when(s.str.contains(r"^\d*\.?\d+\s*$"))
+                .then(s.str.replace_all(" ", "", literal=True))
+                .otherwise(s)
+                .alias(col)
+            )
+
+        cleaned = (
+            pl.from_pandas(df[target_columns])
+            .lazy()
+            .with_columns([clean_expr(col) for col in target_columns])
+            .collect()
+            .to_pandas()
+        )
+        for col in target_columns:
+            # from_pandas/to_pandas round-trips drop the original index, so
+            # align positionally; index-based assignment would turn every
+            # cleaned column into NaN on frames with a non-default index.
+            df[col] = cleaned[col].astype(_STRING_DTYPE).set_axis(df.index)
+        return df
+
+    def transform(self, data_container: DataContainer) -> DataContainer:
+        """Clean the configured text columns of the DataFrame."""
+        if not self.can_transform(data_container):
+            raise ValueError(
+                "Data must be a pandas DataFrame with the specified columns"
+            )
+
+        # Shallow copy: whole-column assignments below create new blocks in
+        # this frame only; untouched columns keep sharing the source arrays.
+        df = data_container.data.copy(deep=False)
+        target_columns = self._target_columns(df)
+
+        if self.backend == "polars" and target_columns:
+            df = self._clean_columns_polars(df, target_columns)
+        else:
+            for col in target_columns:
+                df[col] = self._clean_series(df[col])
+
+        # Track changes in metadata
+        changes = {
+            "processor": self.name,
+            "transformations": {"columns": target_columns},
+        }
+
+        new_metadata = data_container.metadata.copy()
+        new_metadata["dtypes"] = {col: str(dtype) for col, dtype in df.dtypes.items()}
+        new_metadata["transformation_history"] = new_metadata.get(
+            "transformation_history", []
+        ) + [changes]
+
+        return DataContainer(
+            data=df,
+            metadata=new_metadata,
+        )
@@ -2,10 +2,36 @@ from enum import Enum
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Type
 import copy
+import logging
+import sys
 from abc import ABC
+from functools import lru_cache
+import os.path
 import importlib
 import pkgutil
-import inspect
+
+logger = logging.getLogger(__name__)
+
+
+def preferred_string_dtype() -> str:
+    """Return the pandas string dtype to use for text columns.
+
+    Arrow-backed strings keep the data in contiguous buffers and run the
+    .str kernels without per-cell Python objects; fall back to the default
+    string dtype when pyarrow is not installed.
+    """
+    try:
+        importlib.import_module("pyarrow")
+    except ImportError:
+        return "string"
+    return "string[pyarrow]"
+
+
+def _iter_subclasses(cls):
+    """Yield all transitive subclasses of ``cls``."""
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_subclasses(subclass)
 
 
 class DataCategory(Enum):
@@ -25,10 +51,25 @@ class DataContainer:
     data: Any
     metadata: Dict[str, Any]
 
+    # Deep-copying a large DataFrame on every construction doubles memory
+    # and adds a full copy per pipeline stage; transformers already copy
+    # before mutating. Subclasses needing full isolation can opt back in.
+    _deepcopy_on_init = False
+
     def __post_init__(self):
-        """Make deep copies of mutable attributes."""
-        object.__setattr__(self, "data", copy.deepcopy(self.data))
-        object.__setattr__(self, "metadata", copy.deepcopy(self.metadata))
+        """Copy mutable attributes (deeply only when opted in)."""
+        if self._deepcopy_on_init:
+            object.__setattr__(self, "data", copy.deepcopy(self.data))
+            object.__setattr__(self, "metadata", copy.deepcopy(self.metadata))
+        else:
+            object.__setattr__(self, "metadata", dict(self.metadata))
+
+
+@lru_cache(maxsize=None)
+def _suffix_supported(plugin_class, suffix: str) -> bool:
+    """Cached suffix-membership check; repeated dispatches over the same
+    file type become a dict lookup."""
+    return suffix in getattr(plugin_class, "supported_extensions", ())
 
 
 class BasePlugin(ABC):
@@ -40,6 +81,36 @@ class BasePlugin(ABC):
 
     name: str = ""
 
+    def __init_subclass__(cls, **kwargs):
+        """Validate and normalize declared extensions at class creation.
+
+        Normalizing here (rather than at registration) keeps the cached
+        can_handle answers valid: a can_handle call made before the plugin
+        is registered sees the same extension set as one made after.
+        """
+        super().__init_subclass__(**kwargs)
+        extensions = cls.__dict__.get("supported_extensions")
+        if extensions is not None:
+            for ext in extensions:
+                if not ext.startswith("."):
+                    raise ValueError(
+                        f"Plugin {cls.__name__} extension '{ext}' "
+                        "must start with '.'"
+                    )
+            cls.supported_extensions = frozenset(
+                sys.intern(ext.lower()) for ext in extensions
+            )
+
+    @classmethod
+    def can_handle(cls, file_path) -> bool:
+        """Check whether this plugin supports the file's extension.
+
+        Accepts a Path or a plain string; the suffix is taken from the
+        string form so dispatch does not construct a Path object per call.
+        """
+        _, suffix = os.path.splitext(str(file_path))
+        return _suffix_supported(cls, suffix.lower())
+
     @classmethod
     def get_plugin_type(cls) -> str:
         """Get the type of plugin (e.g., 'loader', 'transformer')."""
@@ -49,10 +120,15 @@ class BasePlugin(ABC):
 class PluginManager(ABC):
     """Base class for plugin management."""
 
+    # Discovered plugin classes per manager class; the pkgutil/import scan
+    # only runs on the first construction of each manager type.
+    _plugin_cache: Dict[type, List[Type[BasePlugin]]] = {}
+
     def __init__(self):
         """Initialize plugin manager."""
         self.plugins: Dict[str, Type[BasePlugin]] = {}
         self._plugin_registry: List[Type[BasePlugin]] = []
+        self._ext_index: Dict[str, Type[BasePlugin]] = {}
         self._register_builtin_plugins()
 
     def register_plugin(self, plugin_class: Type[BasePlugin]) -> None:
@@ -60,43 +136,57 @@ class PluginManager(ABC):
         if not plugin_class.name:
             raise ValueError(f"Plugin {plugin_class.__name__} must have a name")
 
+        # Extensions are already validated and normalized (lowercased,
+        # interned frozenset) by BasePlugin.__init_subclass__.
+        extensions = getattr(plugin_class, "supported_extensions", None)
+
         self.plugins[plugin_class.name] = plugin_class
 
+        # Keep an extension index so file-based lookup is one dict hit
+        # instead of a can_handle scan over every plugin.
+        if extensions is not None:
+            for ext in extensions:
+                self._ext_index.setdefault(ext, plugin_class)
+
     def _register_builtin_plugins(self) -> None:
         """Discover and register all plugins in the package."""
+        cached = PluginManager._plugin_cache.get(type(self))
+        if cached is not None:
+            for plugin_class in cached:
+                self.register_plugin(plugin_class)
+                self._plugin_registry.append(plugin_class)
+            return
+
         # Get the directory containing the current plugin manager implementation
         current_module = self.__class__.__module__
 
-        try:
-            # Import the package containing the plugins
-            package = importlib.import_module(current_module)
-            package_path = getattr(package, "__path__", [])
-
-            # Discover all modules in the package
-            for _, module_name, _ in pkgutil.iter_modules(package_path):
-                full_module_name = f"{current_module}.{module_name}"
-
-                try:
-                    module = importlib.import_module(full_module_name)
-
-                    # Find all classes in the module
-                    for name, obj in inspect.getmembers(module):
-                        if (
-                            inspect.isclass(obj)
-                            and issubclass(obj, BasePlugin)
-                            and obj != BasePlugin
-                            and hasattr(obj, "name")
-                            and obj.name  # Must have a non-empty name
-                            and obj.__module__ == module.__name__
-                        ):  # Only register plugins defined in this module
-                            self.register_plugin(obj)
-                            self._plugin_registry.append(obj)
-
-                except Exception as e:
-                    raise e
-
-        except Exception as e:
-            raise e
+        # Import the package containing the plugins
+        package = importlib.import_module(current_module)
+        package_path = getattr(package, "__path__", [])
+
+        # Import all modules in the package so their plugin classes exist
+        for _, module_name, _ in pkgutil.iter_modules(package_path):
+            full_module_name = f"{current_module}.{module_name}"
+
+            try:
+                importlib.import_module(full_module_name)
+            except Exception as e:
+                # A plugin module with missing optional dependencies should
+                # not break discovery of the remaining plugins.
+                logger.debug("Error loading plugin module %s: %s", full_module_name, e)
+
+        # Walk the BasePlugin subclass tree instead of inspecting every
+        # attribute of every module; only plugin classes are visited.
+        for plugin_class in _iter_subclasses(BasePlugin):
+            if (
+                getattr(plugin_class, "name", "")  # Must have a non-empty name
+                and plugin_class.__module__.startswith(f"{current_module}.")
+                and plugin_class not in self._plugin_registry
+            ):  # Only register plugins defined in this package
+                self.register_plugin(plugin_class)
+                self._plugin_registry.append(plugin_class)
+
+        PluginManager._plugin_cache[type(self)] = list(self._plugin_registry)
 
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
         """Get plugin instance by name."""
@@ -105,6 +195,14 @@ class PluginManager(ABC):
             return plugin_class()
         return None
 
+    def get_plugin_for_file(self, file_path) -> Optional[BasePlugin]:
+        """Get a plugin instance that supports the file's extension."""
+        _, suffix = os.path.splitext(str(file_path))
+        plugin_class = self._ext_index.get(suffix.lower())
+        if plugin_class:
+            return plugin_class()
+        return None
+
     def list_plugins(self) -> List[str]:
         """List all registered plugins."""
         plugins = self.plugins
@@ -1,10 +1,62 @@
 """Logging configuration for the project."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional, Union
 
+# Formatters are stateless; build them once instead of on every
+# setup_logging call (each construction compiles the format string).
+_CONSOLE_FORMATTER = logging.Formatter("%(levelname)-8s %(name)-12s: %(message)s")
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s %(levelname)-8s %(name)-12s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Background listener draining the log queue into the file handler; kept at
+# module scope so a later setup_logging call can stop it cleanly. The
+# memory/file handler pair sits behind the queue rather than on the logger,
+# so it is tracked here too and flushed/closed on reconfiguration.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_file_chain: tuple = ()
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener and flush/close the memory/file chain.
+
+    Runs on reconfiguration and at interpreter exit; the listener thread is
+    a daemon, so without an explicit stop any records still in the queue or
+    the MemoryHandler buffer would be lost on a clean exit.
+    """
+    global _queue_listener, _file_chain
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    # Closing the MemoryHandler flushes its buffered records into the file
+    # handler before that handler is closed in turn.
+    for handler in _file_chain:
+        handler.close()
+    _file_chain = ()
+
+
+# Registered after logging's own shutdown hook, so it runs before it and
+# the file handler is still open when the queue is drained.
+atexit.register(_stop_listener)
+
+
+def flush_logs() -> None:
+    """Flush buffered file records to disk immediately.
+
+    The file path trades write latency for throughput (queue plus a
+    1024-record MemoryHandler); call this when records must be on disk
+    now, e.g. right before handing the log file to another process.
+    """
+    for handler in _file_chain:
+        handler.flush()
+
 
 def setup_logging(
     level: str = "INFO",
@@ -22,15 +74,22 @@ def setup_logging(
         disabled: If True, disables all logging. If a list, disables logging for specified modules
             e.g. ["gaubongai.data_management", "gaubongai.data_management.loaders"]
     """
-    # Create formatters
-    console_formatter = logging.Formatter("%(levelname)-8s %(name)-12s: %(message)s")
-    file_formatter = logging.Formatter(
-        "%(asctime)s %(levelname)-8s %(name)-12s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    # Setup root logger
+    # Setup root logger. Propagation is switched off before any handler is
+    # attached so records emitted mid-setup never double-dispatch through
+    # the root ancestor.
+    global _queue_listener, _file_chain
+
     root_logger = logging.getLogger("gaubongai")
+    root_logger.propagate = False
+
+    # Repeated setup calls must not stack handlers (each duplicate means an
+    # extra write per record); drop the ones from previous configurations.
+    # This runs before the disabled early-return so disabling also tears
+    # down the listener thread and releases the log file.
+    _stop_listener()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
 
     # Handle disabling loggers
     if disabled is True:
@@ -47,23 +106,52 @@ def setup_logging(
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     root_logger.addHandler(console_handler)
 
-    # File handler if specified
+    # File handler if specified. Records go through a queue so application
+    # threads pay a queue.put instead of a write() syscall; a background
+    # listener batches them into the file via a MemoryHandler.
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
-
-    # Set specific levels for modules if provided
+        file_handler.setFormatter(_FILE_FORMATTER)
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        _file_chain = (memory_handler, file_handler)
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, memory_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    # Set specific levels for modules if provided; skip unchanged loggers so
+    # logging's internal level cache is not invalidated for nothing.
     if module_levels:
-        for module, level in module_levels.items():
-            logging.getLogger(module).setLevel(level)
+        for module, module_level in module_levels.items():
+            if isinstance(module_level, str):
+                module_level = logging.getLevelName(module_level.upper())
+            module_logger = logging.getLogger(module)
+            if module_logger.level != module_level:
+                module_logger.setLevel(module_level)
 
-    # Prevent logs from propagating to the root logger
-    root_logger.propagate = False
+
+def log_if(logger: logging.Logger, level: int, factory, *args, **kwargs) -> None:
+    """Log at ``level`` only when it is enabled, deferring message building.
+
+    Args:
+        logger: Logger to emit on
+        level: Logging level, e.g. ``logging.DEBUG``
+        factory: Message string, or a zero-argument callable returning one.
+            Callables are only invoked when the level is enabled, so
+            expensive formatting/repr work is skipped on disabled levels.
+        *args: Extra arguments forwarded to ``logger.log``
+    """
+    if logger.isEnabledFor(level):
+        message = factory() if callable(factory) else factory
+        logger.log(level, message, *args, **kwargs)
 
 
 def disable_all_logging():